@@ -1,32 +1,190 @@
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from boto3 import Session
-from botocore.exceptions import ClientError
-import openai
-from datetime import datetime
-import json
-import re
-import os
+from botocore.session import get_session
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import orjson
+import threading
+import time
+from operator import itemgetter
 
-# Initialize session states
-if 'aws_connected' not in st.session_state:
-    st.session_state.aws_connected = False
-if 'aws_expert' not in st.session_state:
-    st.session_state.aws_expert = None
-if 'chat_history' not in st.session_state:
-    st.session_state.chat_history = []
-if 'current_region' not in st.session_state:
-    st.session_state.current_region = None
+from aws_helpers import (
+    AWS_CLIENT_MAX_ENTRIES,
+    AWS_REGIONS,
+    AWS_SESSION_MAX_ENTRIES,
+    AWS_SESSION_TTL,
+    AWS_TOOLS,
+    BOTO_CONFIG,
+    BOTO_LOADER,
+    CHAT_MAX_TOKENS,
+    CHAT_MODEL,
+    COMPLETION_CACHE_ENABLED,
+    COMPLETION_CACHE_SIZE,
+    COMPLETION_TTL,
+    MAX_COMMAND_WORKERS,
+    MAX_INSTANCE_COUNT,
+    RECENT_TURNS,
+    STATIC_SYSTEM_PROMPT,
+    SUMMARY_BATCH,
+    SUMMARY_MAX_TOKENS,
+    SUMMARY_MODEL,
+    SUMMARY_PROMPT,
+    SUPPORTED_INSTANCE_TYPES,
+    init_session_state,
+)
 
-# Load OpenAI API key from secrets
-openai.api_key = st.secrets["OPENAI_API_KEY"]
+init_session_state()
+
+@st.cache_resource
+def get_openai_client(api_key):
+    """Build one pooled OpenAI client per API key, shared across reruns"""
+    # Imported on first use so the sidebar renders without loading the SDK
+    import httpx
+    from openai import OpenAI
+    
+    return OpenAI(
+        api_key=api_key,
+        timeout=httpx.Timeout(connect=5.0, read=30.0, write=10.0, pool=5.0),
+        max_retries=3,
+        http_client=httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+        )
+    )
+
+@st.cache_resource
+def _completion_cache():
+    """Finished completions keyed by (model, messages), shared across reruns.
+
+    Every session reads and writes the same dict from its own script thread,
+    so it comes with a lock guarding all access.
+    """
+    return {}, threading.Lock()
+
+def _chat_stream(model, messages):
+    """Yield reply text as it arrives, replaying cached answers.
+
+    Returns (text, commands) when exhausted, where commands is a tuple of
+    (tool name, arguments) pairs requested by the model.
+    """
+    cache, lock = _completion_cache()
+    key = (model, tuple((m["role"], m["content"]) for m in messages))
+    cached = None
+    if COMPLETION_CACHE_ENABLED:
+        with lock:
+            cached = cache.get(key)
+    if cached and time.monotonic() - cached[0] < COMPLETION_TTL:
+        _, text, commands = cached
+        if text:
+            yield text
+        return text, commands
+    
+    client = get_openai_client(st.secrets["OPENAI_API_KEY"])
+    stream = client.chat.completions.create(
+        model=model,
+        temperature=0,
+        max_tokens=CHAT_MAX_TOKENS,
+        stream=True,
+        messages=messages,
+        tools=AWS_TOOLS
+    )
+    parts = []
+    tool_calls = {}
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta
+        if delta.content:
+            parts.append(delta.content)
+            yield delta.content
+        # Tool call names and arguments arrive in fragments, keyed by index
+        for call in delta.tool_calls or ():
+            entry = tool_calls.setdefault(call.index, {"name": "", "arguments": ""})
+            if call.function and call.function.name:
+                entry["name"] += call.function.name
+            if call.function and call.function.arguments:
+                entry["arguments"] += call.function.arguments
+    
+    text = ''.join(parts)
+    commands = tuple(
+        (call["name"], orjson.loads(call["arguments"] or "{}"))
+        for _, call in sorted(tool_calls.items())
+    )
+    
+    # Only completed streams are cached; evict the oldest entry when full
+    if COMPLETION_CACHE_ENABLED:
+        with lock:
+            cache.pop(key, None)
+            if len(cache) >= COMPLETION_CACHE_SIZE:
+                cache.pop(next(iter(cache)), None)
+            cache[key] = (time.monotonic(), text, commands)
+    return text, commands
+
+def _summarize_history(summary, turns):
+    """Fold older turns into the running summary using a cheaper model"""
+    transcript = "\n".join(f"{turn['role']}: {turn['content']}" for turn in turns)
+    client = get_openai_client(st.secrets["OPENAI_API_KEY"])
+    completion = client.chat.completions.create(
+        model=SUMMARY_MODEL,
+        temperature=0,
+        max_tokens=SUMMARY_MAX_TOKENS,
+        messages=[
+            {"role": "system", "content": SUMMARY_PROMPT},
+            {"role": "user", "content": f"Current summary:\n{summary}\n\nNew turns:\n{transcript}"}
+        ]
+    )
+    return completion.choices[0].message.content
+
+@st.cache_data(show_spinner=False, ttl=3600, max_entries=32)
+def _latest_amzn2_ami(_ec2, region):
+    """Return the newest Amazon Linux 2 AMI ID in region, refreshed hourly"""
+    response = _ec2.describe_images(
+        Filters=[
+            {'Name': 'name', 'Values': ['amzn2-ami-hvm-*-x86_64-gp2']},
+            {'Name': 'state', 'Values': ['available']},
+            {'Name': 'architecture', 'Values': ['x86_64']},
+            {'Name': 'root-device-type', 'Values': ['ebs']}
+        ],
+        Owners=['amazon']
+    )
+    return max(response['Images'], key=itemgetter('CreationDate'))['ImageId']
+
+@st.cache_resource(ttl=AWS_SESSION_TTL, max_entries=AWS_SESSION_MAX_ENTRIES)
+def _get_aws_session(credentials_hash, _access_key, _secret_key, region):
+    """Build one boto3 Session per (credentials, region), shared across reruns"""
+    botocore_session = get_session()
+    botocore_session.register_component('data_loader', BOTO_LOADER)
+    session = Session(
+        aws_access_key_id=_access_key,
+        aws_secret_access_key=_secret_key,
+        region_name=region,
+        botocore_session=botocore_session
+    )
+    # boto3 appends its data path to the loader for every Session; keep one copy
+    BOTO_LOADER.search_paths[:] = dict.fromkeys(BOTO_LOADER.search_paths)
+    return session
+
+@st.cache_resource(ttl=AWS_SESSION_TTL, max_entries=AWS_CLIENT_MAX_ENTRIES)
+def _get_aws_client(_session, credentials_hash, region, service):
+    """Build one client per (credentials, region, service), shared across reruns"""
+    return _session.client(service, config=BOTO_CONFIG)
 
 class AWSCommandExecutor:
-    def __init__(self, session, region):
-        self.session = session
+    def __init__(self, ec2, s3, region):
+        self.ec2 = ec2
+        self.s3 = s3
         self.region = region
+        # Operations the model may request, by tool name
+        self._operations = {
+            'create_ec2_instance': self.create_ec2_instance,
+            'create_vpc': self.create_vpc,
+            'create_s3_bucket': self.create_s3_bucket
+        }
         
     def create_vpc(self, cidr_block, name='MyVPC'):
-        ec2 = self.session.client('ec2')
+        ec2 = self.ec2
         try:
             vpc = ec2.create_vpc(CidrBlock=cidr_block)
             vpc_id = vpc['Vpc']['VpcId']
@@ -41,27 +199,18 @@ class AWSCommandExecutor:
         except Exception as e:
             return f"Failed to create VPC: {str(e)}"
     
-    def create_ec2_instance(self, instance_type='t2.micro', name='MyInstance'):
-        ec2 = self.session.client('ec2')
+    def create_ec2_instance(self, instance_type='t2.micro', name='MyInstance', count=1):
+        ec2 = self.ec2
         try:
             # Get latest Amazon Linux 2 AMI
-            response = ec2.describe_images(
-                Filters=[
-                    {'Name': 'name', 'Values': ['amzn2-ami-hvm-*-x86_64-gp2']},
-                    {'Name': 'state', 'Values': ['available']}
-                ],
-                Owners=['amazon']
-            )
-            ami_id = sorted(response['Images'], 
-                          key=lambda x: x['CreationDate'],
-                          reverse=True)[0]['ImageId']
+            ami_id = _latest_amzn2_ami(ec2, self.region)
             
             # Launch instance
             instance = ec2.run_instances(
                 ImageId=ami_id,
                 InstanceType=instance_type,
-                MinCount=1,
-                MaxCount=1,
+                MinCount=count,
+                MaxCount=count,
                 TagSpecifications=[
                     {
                         'ResourceType': 'instance',
@@ -72,13 +221,15 @@ class AWSCommandExecutor:
                 ]
             )
             
-            instance_id = instance['Instances'][0]['InstanceId']
-            return f"EC2 instance created successfully. Instance ID: {instance_id}"
+            instance_ids = ", ".join(i['InstanceId'] for i in instance['Instances'])
+            if count == 1:
+                return f"EC2 instance created successfully. Instance ID: {instance_ids}"
+            return f"{count} EC2 instances created successfully. Instance IDs: {instance_ids}"
         except Exception as e:
             return f"Failed to create EC2 instance: {str(e)}"
     
     def create_s3_bucket(self, bucket_name):
-        s3 = self.session.client('s3')
+        s3 = self.s3
         try:
             if self.region == 'us-east-1':
                 s3.create_bucket(Bucket=bucket_name)
@@ -91,76 +242,79 @@ class AWSCommandExecutor:
         except Exception as e:
             return f"Failed to create S3 bucket: {str(e)}"
 
-    def execute_command(self, command_text):
-        """Parse and execute AWS commands from natural language or AWS CLI format"""
-        command_text = command_text.lower()
+    def execute_command(self, name, arguments):
+        """Execute one operation requested through a tool call"""
+        operation = self._operations.get(name)
+        if operation is None:
+            return f"Error: Operation '{name}' is not supported"
         
-        # Parse for EC2 instance creation
-        if "create" in command_text and "ec2" in command_text:
-            instance_type = 't2.micro'  # default
-            name = 'MyInstance'
-            
-            # Extract instance type if specified
-            type_match = re.search(r't[23]\.(micro|small|medium|large)', command_text)
-            if type_match:
-                instance_type = type_match.group(0)
-            
-            # Extract name if specified
-            name_match = re.search(r'name[d:\s]+(["\']?([\w-]+)["\']?)', command_text, re.IGNORECASE)
-            if name_match:
-                name = name_match.group(2)
-            
-            return self.create_ec2_instance(instance_type, name)
+        instance_type = arguments.get('instance_type')
+        if instance_type is not None and instance_type not in SUPPORTED_INSTANCE_TYPES:
+            return f"Error: Instance type '{instance_type}' is not supported"
         
-        # Parse for VPC creation
-        elif "create" in command_text and "vpc" in command_text:
-            cidr = "10.0.0.0/16"  # default
-            name = 'MyVPC'
-            
-            # Extract CIDR if specified
-            cidr_match = re.search(r'(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}/\d{1,2})', command_text)
-            if cidr_match:
-                cidr = cidr_match.group(1)
-            
-            # Extract name if specified
-            name_match = re.search(r'name[d:\s]+(["\']?([\w-]+)["\']?)', command_text, re.IGNORECASE)
-            if name_match:
-                name = name_match.group(2)
-            
-            return self.create_vpc(cidr, name)
+        count = arguments.get('count', 1)
+        if name == 'create_ec2_instance' and not (isinstance(count, int) and 1 <= count <= MAX_INSTANCE_COUNT):
+            return f"Error: Instance count must be between 1 and {MAX_INSTANCE_COUNT}"
         
-        # Parse for S3 bucket creation
-        elif "create" in command_text and ("s3" in command_text or "bucket" in command_text):
-            # Extract bucket name
-            bucket_match = re.search(r'bucket[:\s]+(["\']?([\w.-]+)["\']?)', command_text, re.IGNORECASE)
-            if bucket_match:
-                bucket_name = bucket_match.group(2)
-                return self.create_s3_bucket(bucket_name)
-            else:
-                return "Error: Bucket name not specified"
-        
-        return "Command not recognized or not supported"
+        return operation(**arguments)
+
+def _coalesce_commands(commands):
+    """Merge identical EC2 launches into one call and drop repeated bucket creations"""
+    first = {}
+    coalesced = []
+    for name, arguments in commands:
+        count = arguments.get('count', 1) if isinstance(arguments, dict) else None
+        # Identical VPC requests are kept; two VPCs may well be intended.
+        # Bad arguments or counts are rejected later by execute_command.
+        if name not in ('create_ec2_instance', 'create_s3_bucket') or not isinstance(count, int):
+            coalesced.append((name, arguments))
+            continue
+        # Launches differing only in count are merged by adding the counts
+        key = (name, orjson.dumps(
+            {k: v for k, v in arguments.items() if k != 'count'},
+            option=orjson.OPT_SORT_KEYS
+        ))
+        if key not in first:
+            first[key] = len(coalesced)
+            coalesced.append((name, dict(arguments)))
+        elif name == 'create_ec2_instance':
+            merged = coalesced[first[key]][1]
+            merged['count'] = merged.get('count', 1) + count
+    return coalesced
 
 class AWSExpert:
     def __init__(self, region=None):
         self.aws_session = None
         self.region = region
         self.executor = None
+        self._ec2 = None
+        self._s3 = None
+        self._sts = None
+        # Conversation memory: recent turns verbatim plus a summary of older ones
+        self._recent = deque(maxlen=RECENT_TURNS)
+        self._summary = ""
+        # Operations requested by the last reply from get_gpt_response, and
+        # the turn waiting to be recorded once they have run
+        self.pending_commands = ()
+        self._pending_turn = None
 
     def connect_aws(self, access_key, secret_key, region):
         try:
             self.region = region
-            self.aws_session = Session(
-                aws_access_key_id=access_key,
-                aws_secret_access_key=secret_key,
-                region_name=region
-            )
+            # Hash the credentials so the secret is never part of the cache key
+            credentials_hash = hashlib.sha256(f"{access_key}:{secret_key}".encode()).hexdigest()
+            self.aws_session = _get_aws_session(credentials_hash, access_key, secret_key, region)
+            
+            # Reuse service clients built by earlier connections
+            self._ec2 = _get_aws_client(self.aws_session, credentials_hash, region, 'ec2')
+            self._s3 = _get_aws_client(self.aws_session, credentials_hash, region, 's3')
+            self._sts = _get_aws_client(self.aws_session, credentials_hash, region, 'sts')
+            
             # Test connection
-            sts = self.aws_session.client('sts')
-            sts.get_caller_identity()
+            self._sts.get_caller_identity()
             
             # Initialize command executor
-            self.executor = AWSCommandExecutor(self.aws_session, region)
+            self.executor = AWSCommandExecutor(self._ec2, self._s3, region)
             return True
         except Exception as e:
             st.error(f"Failed to connect to AWS: {str(e)}")
@@ -170,69 +324,160 @@ class AWSExpert:
         self.aws_session = None
         self.region = None
         self.executor = None
+        self._ec2 = None
+        self._s3 = None
+        self._sts = None
+        self._recent.clear()
+        self._summary = ""
+        self._pending_turn = None
+
+    def _remember(self, user_message, reply):
+        """Add an exchange to memory, summarizing the oldest exchanges when it is full"""
+        # Messages are added and dropped in user/assistant pairs, so the
+        # window never starts with an orphaned assistant reply
+        if len(self._recent) + 2 > self._recent.maxlen:
+            oldest = [self._recent[i] for i in range(SUMMARY_BATCH)]
+            try:
+                self._summary = _summarize_history(self._summary, oldest)
+                drop = SUMMARY_BATCH
+            except Exception as e:
+                # Drop only the oldest pair, unsummarized; the next turn tries again
+                st.warning(f"Failed to summarize chat history: {str(e)}")
+                drop = 2
+            for _ in range(drop):
+                self._recent.popleft()
+        self._recent.extend((
+            {"role": "user", "content": user_message},
+            {"role": "assistant", "content": reply}
+        ))
 
     def get_gpt_response(self, user_input):
+        """Stream the assistant reply text, leaving requested operations in pending_commands"""
+        self.pending_commands = ()
+        self._pending_turn = None
         try:
-            region_context = f"Current AWS region: {self.region}. "
-            completion = openai.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": f"""You are an AWS expert. Convert natural language to AWS commands. 
-                     {region_context} Currently supported operations:
-                     1. Create EC2 instances (specify instance type and name)
-                     2. Create VPCs (specify CIDR and name)
-                     3. Create S3 buckets (specify bucket name)
-                     If any information is missing, ask the user for details."""},
-                    {"role": "user", "content": user_input}
-                ]
-            )
-            return completion.choices[0].message.content
+            # Region goes in the user turn so the system prefix stays cacheable
+            user_message = f"[region={self.region}] {user_input}"
+            messages = [{"role": "system", "content": STATIC_SYSTEM_PROMPT}]
+            if self._summary:
+                messages.append({"role": "system", "content": f"Summary of earlier conversation: {self._summary}"})
+            messages.extend(self._recent)
+            messages.append({"role": "user", "content": user_message})
+            
+            text, commands = yield from _chat_stream(CHAT_MODEL, messages)
+            self.pending_commands = commands
+            
+            # Recorded by record_turn, so summarizing never delays the commands
+            self._pending_turn = (user_message, text)
         except Exception as e:
             st.error(f"Failed to get GPT response: {str(e)}")
-            return None
+
+    def record_turn(self, outcomes):
+        """Add the last exchange and its command results to memory"""
+        if self._pending_turn is None:
+            return
+        user_message, text = self._pending_turn
+        self._pending_turn = None
+        # Record operations as text so the history stays a plain transcript
+        results = [
+            f"[{name} {orjson.dumps(arguments).decode()} -> {result}]"
+            for (name, arguments), result in outcomes
+        ]
+        self._remember(user_message, "\n".join([text, *results]).strip())
 
     def execute_aws_command(self, command):
+        """Run one command, returning its result or error text; safe off the script thread"""
         try:
-            return self.executor.execute_command(command)
+            name, arguments = command
+            return self.executor.execute_command(name, arguments)
         except Exception as e:
-            st.error(f"Failed to execute AWS command: {str(e)}")
-            return None
+            return f"Failed to execute AWS command: {str(e)}"
 
-def main():
-    st.title("AWS Expert Assistant")
+    def execute_aws_commands(self, commands):
+        """Execute independent commands concurrently, returning (command, result) pairs in order"""
+        commands = _coalesce_commands(commands)
+        if not commands:
+            return []
+        # Workers draw nothing, but need the script context for st.cache_data
+        ctx = get_script_run_ctx()
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_COMMAND_WORKERS, len(commands)),
+            initializer=add_script_run_ctx,
+            initargs=(None, ctx)
+        ) as pool:
+            return list(zip(commands, pool.map(self.execute_aws_command, commands)))
+
+@st.fragment
+def _chat_panel(expert):
+    """Chat history and input; submitting a message reruns only this fragment"""
+    # Display chat history
+    for message in st.session_state.chat_history:
+        with st.chat_message(message["role"]):
+            st.write(message["content"])
+
+    # Chat input
+    user_input = st.chat_input("What would you like to do in AWS?")
     
-    # AWS Regions
-    aws_regions = [
-        'us-east-1', 'us-east-2', 'us-west-1', 'us-west-2',
-        'eu-west-1', 'eu-west-2', 'eu-central-1',
-        'ap-southeast-1', 'ap-southeast-2', 'ap-northeast-1'
-    ]
+    if user_input:
+        with st.chat_message("user"):
+            st.write(user_input)
+        st.session_state.chat_history.append({"role": "user", "content": user_input})
 
-    # Sidebar configuration
-    with st.sidebar:
-        st.header("Configuration")
+        with st.chat_message("assistant"):
+            gpt_response = st.write_stream(expert.get_gpt_response(user_input))
+            
+            # Execute the operations the model requested, then render the
+            # results here on the script thread, inside this message
+            outcomes = expert.execute_aws_commands(expert.pending_commands)
+            for _, result in outcomes:
+                if result.startswith(("Failed", "Error")):
+                    st.error(result)
+                else:
+                    st.success(result)
         
-        aws_access_key = st.text_input("AWS Access Key", type="password")
-        aws_secret_key = st.text_input("AWS Secret Key", type="password")
-        selected_region = st.selectbox("AWS Region", aws_regions)
+        # Keep what each operation did, even when the reply was tool calls only
+        lines = [f"- `{name}`: {result}" for (name, _), result in outcomes]
+        content = "\n".join([gpt_response or "", *lines]).strip()
+        if content:
+            st.session_state.chat_history.append({"role": "assistant", "content": content})
         
-        if st.button("Connect"):
-            if aws_access_key and aws_secret_key:
-                st.session_state.aws_expert = AWSExpert(selected_region)
-                if st.session_state.aws_expert.connect_aws(aws_access_key, aws_secret_key, selected_region):
-                    st.session_state.aws_connected = True
-                    st.session_state.current_region = selected_region
-                    st.success(f"Connected to AWS in region {selected_region}!")
-            else:
-                st.error("Please provide AWS credentials")
+        # May call the summary model, so it runs after the commands
+        expert.record_turn(outcomes)
 
-        if st.session_state.aws_connected and st.button("Disconnect"):
-            if st.session_state.aws_expert:
-                st.session_state.aws_expert.disconnect_aws()
-            st.session_state.aws_connected = False
-            st.session_state.aws_expert = None
-            st.session_state.current_region = None
-            st.success("Disconnected from AWS")
+@st.fragment
+def _sidebar_config():
+    """Credentials and region controls; editing them reruns only this fragment"""
+    st.header("Configuration")
+    
+    aws_access_key = st.text_input("AWS Access Key", type="password")
+    aws_secret_key = st.text_input("AWS Secret Key", type="password")
+    selected_region = st.selectbox("AWS Region", AWS_REGIONS)
+    
+    if st.button("Connect"):
+        if aws_access_key and aws_secret_key:
+            st.session_state.aws_expert = AWSExpert(selected_region)
+            if st.session_state.aws_expert.connect_aws(aws_access_key, aws_secret_key, selected_region):
+                st.session_state.aws_connected = True
+                st.session_state.current_region = selected_region
+                # Rerun the whole app so the chat panel appears
+                st.rerun()
+        else:
+            st.error("Please provide AWS credentials")
+
+    if st.session_state.aws_connected and st.button("Disconnect"):
+        if st.session_state.aws_expert:
+            st.session_state.aws_expert.disconnect_aws()
+        st.session_state.aws_connected = False
+        st.session_state.aws_expert = None
+        st.session_state.current_region = None
+        st.rerun()
+
+def main():
+    st.title("AWS Expert Assistant")
+    
+    # Sidebar configuration
+    with st.sidebar:
+        _sidebar_config()
 
     # Main chat interface
     if st.session_state.aws_connected and st.session_state.aws_expert:
@@ -245,36 +490,7 @@ def main():
         3. Create S3 buckets (e.g., "create an S3 bucket named my-unique-bucket")
         """)
         
-        # Display chat history
-        for message in st.session_state.chat_history:
-            with st.chat_message(message["role"]):
-                st.write(message["content"])
-
-        # Chat input
-        user_input = st.chat_input("What would you like to do in AWS?")
-        
-        if user_input:
-            with st.chat_message("user"):
-                st.write(user_input)
-            st.session_state.chat_history.append({"role": "user", "content": user_input})
-
-            gpt_response = st.session_state.aws_expert.get_gpt_response(user_input)
-            
-            if gpt_response:
-                with st.chat_message("assistant"):
-                    st.write(gpt_response)
-                st.session_state.chat_history.append({"role": "assistant", "content": gpt_response})
-
-                # Extract commands and execute them
-                commands = re.findall(r'```(.*?)```', gpt_response, re.DOTALL)
-                if not commands:
-                    # If no code blocks found, treat the entire response as a command
-                    commands = [gpt_response]
-                
-                for command in commands:
-                    result = st.session_state.aws_expert.execute_aws_command(command)
-                    if result:
-                        st.success(result)
+        _chat_panel(st.session_state.aws_expert)
     else:
         st.info("Please connect to AWS using the sidebar")
 
@@ -0,0 +1,160 @@
+"""Constants and helpers shared by the AWS Expert Assistant.
+
+Streamlit re-executes app.py on every rerun, but imported modules run once
+per process, so anything here is built a single time.
+"""
+import streamlit as st
+from botocore.config import Config
+from botocore.loaders import create_loader
+from botocore.session import get_session
+from collections import deque
+import os
+import threading
+
+# Regions offered in the sidebar
+AWS_REGIONS = (
+    'us-east-1', 'us-east-2', 'us-west-1', 'us-west-2',
+    'eu-west-1', 'eu-west-2', 'eu-central-1',
+    'ap-southeast-1', 'ap-southeast-2', 'ap-northeast-1'
+)
+
+# Instance types the assistant will launch
+SUPPORTED_INSTANCE_TYPES = frozenset(
+    f'{family}.{size}' for family in ('t2', 't3') for size in ('micro', 'small', 'medium', 'large')
+)
+
+# Most EC2 instances launched by one create_ec2_instance call
+MAX_INSTANCE_COUNT = 10
+
+# Maximum number of chat messages kept in the session
+MAX_CHAT_HISTORY = 50
+
+# Upper bound on AWS commands executed concurrently from one response
+MAX_COMMAND_WORKERS = 16
+
+# Model that turns user requests into AWS commands. The token cap leaves
+# room for a short reply plus several tool calls without truncating them.
+CHAT_MODEL = 'gpt-4o-mini'
+CHAT_MAX_TOKENS = 1024
+
+# Conversation memory sent to the model: the last RECENT_TURNS messages
+# verbatim, with SUMMARY_BATCH of the oldest folded into a summary when full.
+# Memory holds user/assistant pairs, so both must be even.
+RECENT_TURNS = 8
+SUMMARY_BATCH = 4
+SUMMARY_MODEL = 'gpt-4o-mini'
+SUMMARY_MAX_TOKENS = 300
+
+# Shared by every boto3 client: a pool large enough for the command workers,
+# adaptive client-side retry rate limiting, TCP keepalive, and a short
+# connect timeout so an unreachable endpoint fails fast
+BOTO_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    tcp_keepalive=True,
+    connect_timeout=5,
+    read_timeout=60
+)
+
+# One botocore data loader shared by every session. The loader caches parsed
+# service models, so they are read from disk once per process instead of
+# once per session. Built the way botocore builds its own, so models from
+# AWS_DATA_PATH or data_path in the AWS config are still found.
+BOTO_LOADER = create_loader(get_session().get_config_variable('data_path'))
+PRELOADED_SERVICES = ('ec2', 's3', 'sts')
+
+# Cached boto3 sessions hold the secret key, so each expires after
+# AWS_SESSION_TTL seconds and only the most recent connections are kept.
+# Each session has one client per service in PRELOADED_SERVICES.
+AWS_SESSION_TTL = 3600
+AWS_SESSION_MAX_ENTRIES = 16
+AWS_CLIENT_MAX_ENTRIES = AWS_SESSION_MAX_ENTRIES * len(PRELOADED_SERVICES)
+
+# Finished completions are replayed for this many seconds; set
+# LLM_CACHE_DISABLE=1 to always call the API
+COMPLETION_TTL = 3600
+COMPLETION_CACHE_SIZE = 256
+COMPLETION_CACHE_ENABLED = os.environ.get('LLM_CACHE_DISABLE') != '1'
+
+# Tools the model calls to request operations, one per AWSCommandExecutor
+# create_* method; argument names match the method parameters
+AWS_TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "create_ec2_instance",
+            "description": "Launch an EC2 instance from the latest Amazon Linux 2 AMI",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "instance_type": {"type": "string", "enum": sorted(SUPPORTED_INSTANCE_TYPES)},
+                    "name": {"type": "string", "description": "Name tag for the instance"},
+                    "count": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "maximum": MAX_INSTANCE_COUNT,
+                        "description": "Number of identical instances to launch, default 1"
+                    }
+                },
+                "required": ["instance_type", "name"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "create_vpc",
+            "description": "Create a VPC",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "cidr_block": {"type": "string", "description": "IPv4 CIDR block, e.g. 10.0.0.0/16"},
+                    "name": {"type": "string", "description": "Name tag for the VPC"}
+                },
+                "required": ["cidr_block", "name"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "create_s3_bucket",
+            "description": "Create an S3 bucket in the current region",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "bucket_name": {"type": "string", "description": "Globally unique bucket name"}
+                },
+                "required": ["bucket_name"]
+            }
+        }
+    }
+]
+
+# Kept free of per-request data so OpenAI can reuse the cached prompt prefix
+STATIC_SYSTEM_PROMPT = """You are an AWS expert. Carry out the user's AWS requests by calling the
+provided tools, one call per resource to create. Launch identical EC2
+instances with a single call and set count.
+The user's current AWS region is given in brackets at the start of each message.
+Currently supported operations:
+1. Create EC2 instances (specify instance type and name)
+2. Create VPCs (specify CIDR and name)
+3. Create S3 buckets (specify bucket name)
+If any information is missing, ask the user for details instead of calling a tool."""
+
+SUMMARY_PROMPT = """Summarize this AWS assistant conversation in a few sentences.
+Preserve resource names, CIDR blocks, instance types, regions and resource IDs exactly."""
+
+def init_session_state():
+    """Initialize session states on first run"""
+    st.session_state.setdefault('aws_connected', False)
+    st.session_state.setdefault('aws_expert', None)
+    st.session_state.setdefault('chat_history', deque(maxlen=MAX_CHAT_HISTORY))
+    st.session_state.setdefault('current_region', None)
+
+def _preload_service_models():
+    """Parse the service models the app uses before the user clicks Connect"""
+    for service in PRELOADED_SERVICES:
+        BOTO_LOADER.load_service_model(service, 'service-2')
+
+threading.Thread(target=_preload_service_models, daemon=True).start()